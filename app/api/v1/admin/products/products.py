@@ -1,5 +1,6 @@
 import dataclasses
 
+from bson.errors import InvalidId
 from flask import Blueprint, current_app, request
 
 from app.api import exceptions
@@ -7,7 +8,6 @@ from app.middlewares import requires_auth, requires_role
 from app.models import exceptions as models_exceptions
 from app.models import get_models
 from app.models.products import Product, ProductCreate, ProductPatch
-from lib.db_utils import to_json
 from lib.http_utils import respond_error, respond_success
 from .router import products_controller
 
@@ -17,12 +17,9 @@ from .router import products_controller
 @requires_role('admin')
 def get_products():
     product_model = get_models(current_app).products
-    products = product_model.get_all()
+    products = product_model.get_all(projection=product_model.list_projection)
 
-    if products is None:
-        raise models_exceptions.NotFoundException(Product.__name__)
-
-    return respond_success(to_json(products))
+    return respond_success([product.to_json() for product in products])
 
 
 @products_controller.route('/<string:product_id>', methods=["GET"])
@@ -30,7 +27,11 @@ def get_products():
 @requires_role('admin')
 def get_product_by_id(product_id):
     product_model = get_models(current_app).products
-    product = product_model.get(product_id)
+
+    try:
+        product = product_model.get(product_id)
+    except InvalidId:
+        raise exceptions.BadRequestException(f'The product id {product_id} is invalid.')
 
     if product is None:
         raise models_exceptions.NotFoundException(Product.__name__)
@@ -94,6 +95,8 @@ def update_product(product_id):
             raise models_exceptions.NotFoundException(Product.__name__)
 
         return respond_success(product.to_json())
+    except InvalidId:
+        raise exceptions.BadRequestException(f'The product id {product_id} is invalid.')
     except TypeError:
         raise exceptions.BadRequestException("Bad request.")
 
@@ -103,7 +106,11 @@ def update_product(product_id):
 @requires_role('admin')
 def delete_product(product_id):
     product_model = get_models(current_app).products
-    result = product_model.delete(product_id)
+
+    try:
+        result = product_model.delete(product_id)
+    except InvalidId:
+        raise exceptions.BadRequestException(f'The product id {product_id} is invalid.')
 
     if result == 0:
         return respond_error(f'The product with id {product_id} was not found.', 404)
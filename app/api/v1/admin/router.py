@@ -1,27 +1,55 @@
+import importlib
+from typing import Optional, Set
+
 from flask import Blueprint
 
-from .platforms import platforms_controller
-from .operating_systems import operating_systems_controller
-from .profiles import profiles_controller
-from .products.router import products_controller
-from .products.router import comments_controller
-from .tags import tags_controller
-from .service_profiles import service_profiles_controller
-from .affiliates import affiliates_controller
-from .affiliate_reviews import affiliate_reviews_controller
-from .platform_products import platform_products_controller
-from .affiliate_platform_products import affiliate_platform_products_controller
+from config import app_config
+
+# (module, blueprint) pairs of the admin controllers, relative to this package
+_BLUEPRINTS = (
+    ("platforms", "platforms_controller"),
+    ("operating_systems", "operating_systems_controller"),
+    ("profiles", "profiles_controller"),
+    ("products", "products_controller"),
+    ("products", "comments_controller"),
+    ("platform_products", "platform_products_controller"),
+    ("affiliate_platform_products", "affiliate_platform_products_controller"),
+    ("tags", "tags_controller"),
+    ("service_profiles", "service_profiles_controller"),
+    ("affiliates", "affiliates_controller"),
+    ("affiliate_reviews", "affiliate_reviews_controller"),
+)
+
+
+def parse_enabled_modules(value: Optional[str]) -> Optional[Set[str]]:
+    """Parses the comma separated FLASK_ADMIN_MODULES setting, e.g. "products, tags"
+
+    Returns:
+        Optional[Set[str]]: The modules to load, None to load every module
+
+    Raises:
+        ValueError: If an entry is not one of the admin modules
+    """
+    if not value:
+        return None
+
+    modules = {name.strip() for name in value.split(",") if name.strip()}
+
+    # A misspelled module would silently drop its endpoints, so unknown names fail the startup
+    unknown_modules = modules - {module_name for module_name, _ in _BLUEPRINTS}
+    if unknown_modules:
+        raise ValueError(f"Unknown FLASK_ADMIN_MODULES entries: {', '.join(sorted(unknown_modules))}")
+
+    return modules
+
+
+_enabled_modules = parse_enabled_modules(app_config["FLASK_ADMIN_MODULES"])
 
 admin_controller = Blueprint('admin', __name__, url_prefix='/admin')
 
-admin_controller.register_blueprint(platforms_controller)
-admin_controller.register_blueprint(operating_systems_controller)
-admin_controller.register_blueprint(profiles_controller)
-admin_controller.register_blueprint(products_controller)
-admin_controller.register_blueprint(comments_controller)
-admin_controller.register_blueprint(platform_products_controller)
-admin_controller.register_blueprint(affiliate_platform_products_controller)
-admin_controller.register_blueprint(tags_controller)
-admin_controller.register_blueprint(service_profiles_controller)
-admin_controller.register_blueprint(affiliates_controller)
-admin_controller.register_blueprint(affiliate_reviews_controller)
+for module_name, controller_name in _BLUEPRINTS:
+    if _enabled_modules is not None and module_name not in _enabled_modules:
+        continue
+
+    module = importlib.import_module(f".{module_name}", __package__)
+    admin_controller.register_blueprint(getattr(module, controller_name))
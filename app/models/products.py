@@ -1,12 +1,15 @@
 from __future__ import annotations
 
-from dataclasses import dataclass, field
-from typing import Dict, List, Optional, Union
+from dataclasses import asdict, dataclass, field, fields, is_dataclass
+from typing import Any, Dict, Iterator, List, Mapping, Optional, Union
 
-from bson import ObjectId
+from bson import ObjectId, encode
+from bson.raw_bson import RawBSONDocument
+from pymongo import ReturnDocument
 
 from app.models.base import BaseDocument, Serializable
 from app.services import Database
+from lib.db_utils import to_bson
 
 
 @dataclass
@@ -102,7 +105,7 @@ class Product(BaseDocument):
             platforms_os: List[str],
             categories: List[ObjectId],
             genres: List[ObjectId],
-            release_date: Dict,
+            release_date: Union[Dict, ReleaseDate],
             **kwargs
     ) -> None:
         super().__init__(**kwargs)
@@ -124,7 +127,29 @@ class Product(BaseDocument):
         self.platforms_os = platforms_os
         self.genres = genres
         self.categories = categories
-        self.release_date = ReleaseDate(**release_date)
+        self.release_date = release_date if isinstance(release_date, ReleaseDate) else ReleaseDate(**release_date)
+
+    @classmethod
+    def _from_doc(cls, doc: dict) -> Product:
+        """
+        Build a product straight from a database document, bypassing ``__init__``.
+
+        The document becomes the instance's ``__dict__``, so it must not be reused by the caller.
+
+        :param dict doc: The product document as returned by the database.
+        :return: The product.
+        :rtype: Product
+        """
+        product = cls.__new__(cls)
+        product.__dict__ = doc
+
+        if not {"_id", "created_at", "updated_at"} <= doc.keys():
+            # Fill in the missing document fields the same way __init__ does
+            BaseDocument.__init__(product, **doc)
+
+        product.release_date = ReleaseDate(**doc["release_date"])
+
+        return product
 
 
 @dataclass
@@ -176,93 +201,163 @@ class ProductsModel:
     """
     Model class for handling product-related database operations.
 
+    Products are looked up by ``slug`` on the public path, so the collection must have
+    the unique ``slug`` index (see the ``add_product_slug_unique_index`` migration).
+
     :param db: The database instance.
     :type db: Database
     """
 
     db: Database
     collection: str = "products"
+    # Heavy fields that product listings do not need
+    list_projection: dict = {"detailed_description": 0, "media.screenshots": 0, "media.movies": 0}
+    _pipeline_tail: tuple[RawBSONDocument, ...]
 
-    def get_aggregation_pipeline(self, query: dict | None = None):
-        if query is None:
-            query = {'$match': {}}
+    def get_aggregation_pipeline(
+            self,
+            match: dict | None = None,
+            limit: int | None = None,
+            projection: dict | None = None
+    ) -> list[Mapping[str, Any]]:
+        """
+        Build the aggregation pipeline that resolves genre and category names.
+
+        The ``$match`` stage is always emitted first (followed by an optional ``$limit``),
+        so the tag lookup only operates on the documents that were matched by the filter.
+        Genres and categories are resolved in a single pass over ``tags``: one lookup joins
+        the union of both id lists and the result is split back with ``$filter``.
+
+        :param match: The filter of the ``$match`` stage, matches every product if omitted.
+        :type match: dict | None
+        :param limit: The maximum number of products to feed into the lookups.
+        :type limit: int | None
+        :param projection: The ``$project`` applied before the lookup, e.g. to drop heavy fields.
+        :type projection: dict | None
+        :return: The aggregation pipeline, the static stages are pre-encoded ``RawBSONDocument`` objects.
+        :rtype: list[Mapping[str, Any]]
+        """
+        pipeline: list[Mapping[str, Any]] = [{'$match': match if match is not None else {}}]
+
+        if limit is not None:
+            pipeline.append({'$limit': limit})
+
+        if projection is not None:
+            pipeline.append({'$project': projection})
+
+        pipeline.extend(self._pipeline_tail)
+
+        return pipeline
+
+    def __init__(self, db: Database) -> None:
+        """
+        Initialize the ProductsModel.
 
-        return [
-            query,
+        :param db: The database instance.
+        :type db: Database
+        """
+        self.db = db
+
+        # The stages after the per-query $match never change, so they are built only once
+        pipeline_tail = (
             {
-                '$lookup': {
-                    'from': 'tags',
-                    'localField': 'genres',
-                    'foreignField': '_id',
-                    'as': 'genres'
+                '$addFields': {
+                    'tag_ids': {
+                        '$setUnion': [
+                            {'$ifNull': ['$genres', []]},
+                            {'$ifNull': ['$categories', []]}
+                        ]
+                    }
                 }
             },
             {
+                # localField/foreignField keeps the join on the tags _id index, $expr with $in would not use it
                 '$lookup': {
                     'from': 'tags',
-                    'localField': 'categories',
+                    'localField': 'tag_ids',
                     'foreignField': '_id',
-                    'as': 'categories'
+                    # Only the name is used, _id is kept to split the tags back into genres and categories
+                    'pipeline': [{'$project': {'_id': 1, 'name': 1}}],
+                    'as': 'tags_joined'
                 }
             },
             {
                 '$addFields': {
                     'genres': {
-                        '$reduce': {
-                            'input': '$genres',
-                            'initialValue': [],
-                            'in': {'$concatArrays': ['$$value', ['$$this.name']]}
+                        '$map': {
+                            'input': {
+                                '$filter': {
+                                    'input': '$tags_joined',
+                                    'as': 'tag',
+                                    'cond': {'$in': ['$$tag._id', {'$ifNull': ['$genres', []]}]}
+                                }
+                            },
+                            'as': 'tag',
+                            'in': '$$tag.name'
                         }
                     },
                     'categories': {
-                        '$reduce': {
-                            'input': '$categories',
-                            'initialValue': [],
-                            'in': {'$concatArrays': ['$$value', ['$$this.name']]}
+                        '$map': {
+                            'input': {
+                                '$filter': {
+                                    'input': '$tags_joined',
+                                    'as': 'tag',
+                                    'cond': {'$in': ['$$tag._id', {'$ifNull': ['$categories', []]}]}
+                                }
+                            },
+                            'as': 'tag',
+                            'in': '$$tag.name'
                         }
                     }
                 }
+            },
+            {
+                '$project': {'tag_ids': 0, 'tags_joined': 0}
             }
-        ]
-
-    def __init__(self, db: Database) -> None:
-        """
-        Initialize the ProductsModel.
-
-        :param db: The database instance.
-        :type db: Database
-        """
-        self.db = db
+        )
+        # Encoded to BSON up front, PyMongo copies the raw bytes into every aggregate command
+        self._pipeline_tail = tuple(RawBSONDocument(encode(stage)) for stage in pipeline_tail)
 
-    def get(self, product_id: str) -> Optional[Product]:
+    def get(self, product_id: str, with_tags: bool = True) -> Optional[Product]:
         """
         Retrieve a product by its ID.
 
+        When the tag names are not needed, the product is fetched with a plain ``find_one``
+        and its genres and categories are left as lists of tag IDs.
+
         :param str product_id: The ID of the product to be retrieved.
+        :param bool with_tags: Whether to resolve genres and categories into tag names.
         :return: The product data if found.
         :rtype: Optional[Product]
         """
-        pipeline = self.get_aggregation_pipeline({"$match": {"_id": ObjectId(product_id)}})
-        product_data = next(self.db.connection[self.collection].aggregate(pipeline), None)
+        product_oid = ObjectId(product_id)
+
+        if with_tags:
+            pipeline = self.get_aggregation_pipeline({"_id": product_oid}, limit=1)
+            product_data = next(self.db.connection[self.collection].aggregate(pipeline, batchSize=1), None)
+        else:
+            product_data = self.db.connection[self.collection].find_one({"_id": product_oid})
 
         if product_data:
             return Product(**product_data)
 
-    def get_all(self):
+    def get_all(self, projection: dict | None = None) -> Iterator[Product]:
         """
         Retrieve all products from the database.
 
-        This method fetches all products from the database and returns them as a list of Product objects.
-        If there are no products found, it returns an empty list.
+        This method lazily yields Product objects while the aggregation cursor is being consumed,
+        so the products are never buffered in memory all at once.
+        If there are no products found, nothing is yielded.
 
-        :return: A list of Product objects representing all the products in the database.
-        :rtype: list[Product]
+        :param projection: The fields to include or exclude, e.g. ``list_projection`` for listings.
+        :type projection: dict | None
+        :return: An iterator of Product objects representing all the products in the database.
+        :rtype: Iterator[Product]
         """
 
-        pipeline = self.get_aggregation_pipeline()
-        products = [Product(**item) for item in self.db.connection[self.collection].aggregate(pipeline)]
+        pipeline = self.get_aggregation_pipeline(projection=projection)
 
-        return products if products else []
+        yield from (Product._from_doc(item) for item in self.db.connection[self.collection].aggregate(pipeline))
 
     def get_by_slug(self, product_slug: str) -> Optional[Product]:
         """
@@ -275,9 +370,9 @@ class ProductsModel:
         :return: The product data if found, otherwise None.
         :rtype: Optional[Product]
         """
-        pipeline = self.get_aggregation_pipeline({"$match": {"slug": product_slug}})
+        pipeline = self.get_aggregation_pipeline({"slug": product_slug}, limit=1)
 
-        product_data = next(self.db.connection[self.collection].aggregate(pipeline), None)
+        product_data = next(self.db.connection[self.collection].aggregate(pipeline, batchSize=1), None)
         if product_data:
             return Product(**product_data)
 
@@ -313,19 +408,44 @@ class ProductsModel:
         """
         Update an existing product in the database.
 
+        The stored product is read first, and if none of the given fields differ from it,
+        it is returned without issuing an update. Otherwise every given field is written,
+        so a patch that changes something costs two round-trips. Writing only the changed
+        fields would let a concurrent write to a skipped field win over this patch.
+
         :param str product_id: The ID of the product to be updated.
         :param input_data: The product data updates.
         :type input_data: ProductPatch
         :return: The updated product data if the update was successful.
         :rtype: Optional[Product]
         """
-        updates = {key: value for key, value in input_data.to_json(
-        ).items() if value is not None}  # Filtering out None values
-        self.db.connection[self.collection].update_one(
-            {"_id": ObjectId(product_id)}, {"$set": updates})
+        product_oid = ObjectId(product_id)
+        updates = {}
+        for patch_field in fields(input_data):
+            value = getattr(input_data, patch_field.name)
+            if value is None:  # Filtering out None values
+                continue
+            # Only the given fields are serialized, nested dataclasses are unpacked as they are
+            if is_dataclass(value) and not isinstance(value, type):
+                updates[patch_field.name] = asdict(value)
+            else:
+                updates[patch_field.name] = to_bson(value)
+
+        existing_product_data = self.db.connection[self.collection].find_one({"_id": product_oid})
+        if existing_product_data is None:
+            return None
+
+        # Dict comparison ignores key order, unlike matching embedded documents on the server
+        if all(existing_product_data.get(key) == value for key, value in updates.items()):
+            # Nothing has changed, return the product as it is
+            return Product(**existing_product_data)
+
+        updated_product_data = self.db.connection[self.collection].find_one_and_update(
+            {"_id": product_oid},
+            {"$set": updates},
+            return_document=ReturnDocument.AFTER
+        )
 
-        updated_product_data = self.db.connection[self.collection].find_one(
-            {"_id": ObjectId(product_id)})
         if updated_product_data:
             return Product(**updated_product_data)
         return None
@@ -338,7 +458,6 @@ class ProductsModel:
         :return: The number of products deleted.
         :rtype: int
         """
-        deletion_result = self.db.connection[self.collection].delete_one(
-            {"_id": ObjectId(product_id)}
-        )
+        product_oid = ObjectId(product_id)
+        deletion_result = self.db.connection[self.collection].delete_one({"_id": product_oid})
         return deletion_result.deleted_count
@@ -1,4 +1,5 @@
 import json
+from typing import Optional
 
 import firebase_admin
 import firebase_admin.auth
@@ -9,27 +10,43 @@ from . import identity_toolkit, secure_token
 # Firebase Admin SDK
 # https://firebase.google.com/docs/reference/admin/python
 
+# The default app is initialized once per process and shared by every Firebase instance
+_firebase_app: Optional[firebase_admin.App] = None
+
 
 class Firebase:
     _app: firebase_admin.App
     _api_key: str
+    _identity_api: identity_toolkit.IdentityToolkitApiClient
+    _secure_token_api: secure_token.SecureTokenAPI
 
     def __init__(self, service_account: str, api_key: str) -> None:
         self._app = self.init_app(service_account)
         self._api_key = api_key
+        # One instance of each API client serves every request and reuses its connections
+        self._identity_api = identity_toolkit.IdentityToolkitApiClient(api_key)
+        self._secure_token_api = secure_token.SecureTokenAPI(api_key)
+
+    def init_app(self, service_account: str) -> firebase_admin.App:
+        global _firebase_app
+
+        if _firebase_app is not None:
+            return _firebase_app
 
-    def init_app(self, service_account: str):
         try:
             # Use an initialized app if one exists
-            return firebase_admin.get_app()
+            app = firebase_admin.get_app()
         except ValueError:
             # Initialize app
-            service_account = json.loads(service_account)
             certificate = firebase_admin.credentials.Certificate(
-                service_account
+                json.loads(service_account)
             )
 
-            return firebase_admin.initialize_app(certificate)
+            app = firebase_admin.initialize_app(certificate)
+
+        _firebase_app = app
+
+        return app
 
     @property
     def auth(self):
@@ -37,8 +54,8 @@ class Firebase:
 
     @property
     def identity_api(self):
-        return identity_toolkit.IdentityToolkitApiClient(self._api_key)
+        return self._identity_api
 
     @property
     def secure_token_api(self):
-        return secure_token.SecureTokenAPI(self._api_key)
+        return self._secure_token_api
@@ -10,14 +10,17 @@ from .dto import (FirebaseCustomIdentity, FirebaseUser, FirebaseUserIdentity,
 class IdentityToolkitApiClient:
     _base_url: str
     _api_key: str
+    _http: urllib3.PoolManager
 
     def __init__(self, api_key: str) -> None:
         self._base_url = "https://identitytoolkit.googleapis.com"
         self._api_key = api_key
+        # Own pool, isolated from other urllib3.request callers that share urllib3's global pool
+        self._http = urllib3.PoolManager(timeout=3)
 
     # https://firebase.google.com/docs/reference/rest/auth#section-sign-in-email-password
     def sign_in(self, email: str, password: str):
-        raw_response = urllib3.request(
+        raw_response = self._http.request(
             "POST",
             f"{self._base_url}/v1/accounts:signInWithPassword?key={self._api_key}",
             json=SignInWithPasswordRequest(email, password).to_json()
@@ -30,7 +33,7 @@ class IdentityToolkitApiClient:
 
     # https://firebase.google.com/docs/reference/rest/auth#section-verify-custom-token
     def sign_in_with_custom_token(self, token: str):
-        raw_response = urllib3.request(
+        raw_response = self._http.request(
             "POST",
             f"{self._base_url}/v1/accounts:signInWithCustomToken?key={self._api_key}",
             json=SignInWithCustomTokenRequest(token).to_json()
@@ -43,7 +46,7 @@ class IdentityToolkitApiClient:
 
     # https://firebase.google.com/docs/reference/rest/auth#section-get-account-info
     def lookup(self, id_token: str):
-        raw_response = urllib3.request(
+        raw_response = self._http.request(
             "POST",
             f"{self._base_url}/v1/accounts:lookup?key={self._api_key}",
             json=LookupRequest(id_token).to_json()
@@ -6,14 +6,17 @@ from .dto import ExchangeRefreshTokenRequest, FirebaseRefreshedToken
 class SecureTokenAPI:
     _base_url: str
     _api_key: str
+    _http: urllib3.PoolManager
 
     def __init__(self, api_key: str) -> None:
         self._base_url = "https://securetoken.googleapis.com"
         self._api_key = api_key
+        # Own pool, isolated from other urllib3.request callers that share urllib3's global pool
+        self._http = urllib3.PoolManager(timeout=3)
 
     # https://firebase.google.com/docs/reference/rest/auth#section-refresh-token
     def exchange_refresh_token(self, refresh_token: str):
-        response = urllib3.request(
+        response = self._http.request(
             "POST",
             f"{self._base_url}/v1/token?key={self._api_key}",
             json=ExchangeRefreshTokenRequest("refresh_token", refresh_token=refresh_token).to_json()
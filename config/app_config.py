@@ -31,5 +31,6 @@ app_config = {
     "FB_NAMESPACE": env.get("FB_NAMESPACE"),
     "FB_SERVICE_ACCOUNT": get_fb_service_account(),
     "FB_API_KEY": env.get("FB_API_KEY"),
-    "FB_M2M_SECRET_KEY": env.get("FB_M2M_SECRET_KEY")
+    "FB_M2M_SECRET_KEY": env.get("FB_M2M_SECRET_KEY"),
+    "FLASK_ADMIN_MODULES": env.get("FLASK_ADMIN_MODULES")
 }
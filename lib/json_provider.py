@@ -0,0 +1,60 @@
+import dataclasses
+import decimal
+import uuid
+from datetime import date
+from typing import Any
+
+import orjson
+from bson import ObjectId
+from flask import Response
+from flask.json.provider import JSONProvider
+from werkzeug.http import http_date
+
+
+def _default(thing: Any):
+    if isinstance(thing, date):
+        # Keep the RFC 822 dates of Flask's default provider, e.g. "Mon, 01 Jan 2024 00:00:00 GMT"
+        return http_date(thing)
+    elif isinstance(thing, (ObjectId, decimal.Decimal, uuid.UUID)):
+        return str(thing)
+    elif hasattr(thing, "__html__"):
+        return str(thing.__html__())
+    elif dataclasses.is_dataclass(thing) and not isinstance(thing, type):
+        return dataclasses.asdict(thing)
+
+    raise TypeError(f"Object of type {type(thing).__name__} is not JSON serializable")
+
+
+def _reject_kwargs(name: str, kwargs: dict[str, Any]):
+    # orjson has no equivalent for json's arguments (indent, ensure_ascii, ...), fail instead of ignoring them
+    if kwargs:
+        raise TypeError(f"OrjsonProvider.{name}() got unsupported arguments: {', '.join(kwargs)}")
+
+
+class OrjsonProvider(JSONProvider):
+    """JSON provider backed by orjson. Like Flask's default provider it sorts keys, uses compact
+    separators, RFC 822 dates and a trailing newline on responses. Unlike it, non-ASCII characters
+    are written as UTF-8 instead of escaped, debug responses are not pretty-printed and dumps/loads
+    take no keyword arguments
+    """
+
+    # Dataclasses go through asdict in _default, orjson would not sort their fields
+    option = (orjson.OPT_NON_STR_KEYS | orjson.OPT_SORT_KEYS | orjson.OPT_PASSTHROUGH_DATETIME
+              | orjson.OPT_PASSTHROUGH_DATACLASS)
+
+    def dumps(self, obj: Any, **kwargs: Any) -> str:
+        _reject_kwargs("dumps", kwargs)
+        return orjson.dumps(obj, default=_default, option=self.option).decode()
+
+    def loads(self, s: str | bytes, **kwargs: Any) -> Any:
+        _reject_kwargs("loads", kwargs)
+        return orjson.loads(s)
+
+    def response(self, *args: Any, **kwargs: Any) -> Response:
+        obj = self._prepare_response_obj(args, kwargs)
+
+        # Skip decoding into a str, the response body is bytes anyway
+        return self._app.response_class(
+            orjson.dumps(obj, default=_default, option=self.option | orjson.OPT_APPEND_NEWLINE),
+            mimetype="application/json"
+        )
@@ -0,0 +1,19 @@
+"""
+Add unique index for the product slug
+"""
+import pymongo.database
+
+name = '1791948297347_add_product_slug_unique_index'
+dependencies = ['1709495379766_add_profile_nickname_unique_index']
+
+
+def upgrade(db: pymongo.database.Database):
+    db.get_collection("products").create_index(
+        "slug",
+        name="slug_unique",
+        unique=True
+    )
+
+
+def downgrade(db: pymongo.database.Database):
+    db.get_collection("products").drop_index("slug_unique")
@@ -0,0 +1,33 @@
+from tests import IntegrationTest
+import lib.constants as constants
+
+
+class ProductsTestCase(IntegrationTest):
+
+    def test_fails_to_handle_a_product_with_an_invalid_id(self):
+        # given
+        admin_user = self.fixtures.admin_user
+        tokens = self.factory.logins.login(
+            admin_user.email, constants.strong_password)
+        headers = {"Authorization": f'Bearer {tokens.id_token}'}
+        invalid_id = "invalid_id"
+
+        requests = [
+            ("GET", None),
+            ("PATCH", {"name": "Updated Name"}),
+            ("DELETE", None)
+        ]
+
+        for method, body in requests:
+            with self.subTest(method):
+                # when
+                response = self.app.open(
+                    f'/v1/admin/products/{invalid_id}',
+                    method=method,
+                    headers=headers,
+                    json=body
+                )
+
+                # then
+                self.assertEqual(response.status_code, 400)
+                self.assertEqual(response.get_json().get("error"), f'The product id {invalid_id} is invalid.')
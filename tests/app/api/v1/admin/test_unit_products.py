@@ -0,0 +1,65 @@
+from unittest.mock import patch, MagicMock
+import json
+from app.api.v1.admin.products import get_product_by_id, update_product, delete_product
+
+from tests import UnitTest
+from app.api.exceptions import BadRequestException
+from app.models.products import ProductsModel
+from tests.utils.jwt import create_test_token
+
+
+class ProductsTestCase(UnitTest):
+
+    @patch("app.api.v1.admin.products.products.get_models")
+    def test_rejects_an_invalid_product_id(self, get_models: MagicMock):
+        get_models.return_value.products = ProductsModel(MagicMock())
+
+        endpoint = "/products/<string:product_id>"
+        self.app.route(endpoint, methods=["GET"])(get_product_by_id)
+        self.app.route(endpoint, methods=["PATCH"])(update_product)
+        self.app.route(endpoint, methods=["DELETE"])(delete_product)
+
+        invalid_id = "invalid_id"
+        expected_error = f'The product id {invalid_id} is invalid.'
+
+        def call_api(method: str, body: dict | None = None):
+            return self.test_client.open(
+                endpoint.replace("<string:product_id>", invalid_id),
+                method=method,
+                data=json.dumps(body) if body is not None else None,
+                content_type='application/json',
+                headers={"Authorization": "Bearer " +
+                         create_test_token("", roles=["admin"])}
+            )
+
+        def fails_to_get_a_product_with_an_invalid_id():
+            # when
+            with self.assertRaises(BadRequestException) as context:
+                call_api("GET")
+
+            # then
+            self.assertEqual(str(context.exception), expected_error)
+
+        def fails_to_patch_a_product_with_an_invalid_id():
+            # when
+            with self.assertRaises(BadRequestException) as context:
+                call_api("PATCH", {"name": "Updated Name"})
+
+            # then
+            self.assertEqual(str(context.exception), expected_error)
+
+        def fails_to_delete_a_product_with_an_invalid_id():
+            # when
+            with self.assertRaises(BadRequestException) as context:
+                call_api("DELETE")
+
+            # then
+            self.assertEqual(str(context.exception), expected_error)
+
+        tests = [
+            fails_to_get_a_product_with_an_invalid_id,
+            fails_to_patch_a_product_with_an_invalid_id,
+            fails_to_delete_a_product_with_an_invalid_id
+        ]
+
+        self.run_subtests(tests)
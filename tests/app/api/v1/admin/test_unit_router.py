@@ -0,0 +1,35 @@
+from app.api.v1.admin.router import parse_enabled_modules
+from tests import UnitTest
+
+
+class AdminRouterTestCase(UnitTest):
+
+    def test_parse_enabled_modules(self):
+
+        def loads_every_module_when_not_set():
+            # when & then
+            self.assertIsNone(parse_enabled_modules(None))
+            self.assertIsNone(parse_enabled_modules(""))
+
+        def strips_the_module_names():
+            # when
+            result = parse_enabled_modules("tags, products ,")
+
+            # then
+            self.assertEqual(result, {"tags", "products"})
+
+        def fails_on_an_unknown_module():
+            # when
+            with self.assertRaises(ValueError) as context:
+                parse_enabled_modules("tags,comments")
+
+            # then
+            self.assertEqual(str(context.exception), "Unknown FLASK_ADMIN_MODULES entries: comments")
+
+        tests = [
+            loads_every_module_when_not_set,
+            strips_the_module_names,
+            fails_on_an_unknown_module
+        ]
+
+        self.run_subtests(tests)
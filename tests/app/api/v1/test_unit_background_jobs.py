@@ -1,8 +1,9 @@
-import json
-from unittest.mock import MagicMock, patch
+from typing import Optional
+from unittest.mock import MagicMock
 
 from bson import ObjectId
 
+import app.api.v1.background_jobs as background_jobs_api
 from app.api.exceptions import BadRequestException
 from app.api.v1.background_jobs import get_background_job, get_all_background_jobs, create_background_job, \
     create_background_job_event, update_background_job
@@ -12,558 +13,503 @@ from config.constants import FirebaseRole
 from lib.db_utils import to_json
 from tests import UnitTest
 from tests.utils.jwt import TEST_AUTH_NAMESPACE, create_test_token
+from tests.utils.patcher import AttrPatcher
+
+# Route rules registered on the test app, each under its own endpoint name
+_ROUTES = (
+    ("/background_jobs/<string:background_job_id>", get_background_job, ["GET"]),
+    ("/background_jobs", get_all_background_jobs, ["GET"]),
+    ("/background_jobs", create_background_job, ["POST"]),
+    ("/background_jobs/<string:background_job_id>", update_background_job, ["PATCH"]),
+    ("/background_jobs/<string:background_job_id>/events", create_background_job_event, ["POST"]),
+)
+
+# URL building templates, kept apart from the route rules registered on the app
+_COLLECTION_PATH = "/background_jobs"
+_GET_PATH_TMPL = "/background_jobs/{bjid}"
+_EVENTS_PATH_TMPL = "/background_jobs/{bjid}/events"
+
+# Request bodies are static, so they are encoded once
+_EMPTY_BODY = b'{}'
+_CREATE_BODY = b'{"type":"es_seeder","metadata":{"match_query":"test"}}'
+_CREATE_BODY_WITHOUT_METADATA = b'{"type":"es_seeder"}'
+_CREATE_BODY_WITH_UNSUPPORTED_TYPE = b'{"type":"unsupported_type","metadata":{}}'
+_PATCH_BODY_RUNNING = b'{"status":"running"}'
+_EVENT_BODY = b'{"type":"info","message":"test"}'
+_EVENT_BODY_WITHOUT_MESSAGE = b'{"type":"info"}'
+_EVENT_BODY_WITH_UNSUPPORTED_TYPE = b'{"type":"unsupported_type","message":"test"}'
+
+
+def _case(case, data=None):
+    return case.__name__, case, data
+
+
+def finds_and_returns_a_background_job(self, mocks, data):
+    # given
+    mock_background_job = self._fixture_bj_owned
+    mocks.get.return_value = mock_background_job
+
+    expected_body = self._expected_owned_body
+
+    # when
+    response = self.call_get_api(str(mock_background_job._id))
+
+    # then
+    self.assertEqual(response.data, expected_body)
+    self.assertEqual(response.status_code, 200)
+    mocks.get.assert_called_once_with(
+        str(mock_background_job._id)
+    )
+
+
+def does_not_find_a_background_job_and_returns_an_error(self, mocks, data):
+    # given
+    mocks.get.return_value = None
+
+    expected_response = {
+        "status": "error",
+        "error": "\"BackgroundJob\" not found."
+    }
+
+    # when
+    with self.assertRaises(NotFoundException):
+        response = self.call_get_api(data["background_job_id"])
+
+        # then
+        self.assertEqual(response.get_json(), expected_response)
+        self.assertEqual(response.status_code, 404)
+        mocks.get.assert_called_once_with(data["background_job_id"])
+
+
+def finds_a_background_job_with_another_creator_and_returns_an_error(self, mocks, data):
+    # given
+    mock_background_job = self._fixture_bj_foreign
+    mocks.get.return_value = mock_background_job
+
+    expected_response = {
+        "status": "error",
+        "error": "Forbidden."
+    }
+
+    # when
+    with self.assertRaises(ForbiddenException):
+        response = self.call_get_api(str(mock_background_job._id))
+
+        # then
+        self.assertEqual(response.get_json(), expected_response)
+        self.assertEqual(response.status_code, 403)
+        mocks.get.assert_called_once_with(
+            str(mock_background_job._id))
+
+
+def finds_and_returns_all_background_jobs(self, mocks, data):
+    # given
+    mock_background_jobs = self._fixture_bjs_owned
+    mocks.get_all.return_value = mock_background_jobs
+
+    expected_body = self._expected_owned_list_body
+
+    # when
+    response = self.call_get_all_api()
+
+    # then
+    self.assertEqual(response.data, expected_body)
+    self.assertEqual(response.status_code, 200)
+    mocks.get_all.assert_called_once()
+
+
+def creates_and_returns_a_background_job(self, mocks, data):
+    # given
+    expected_input = BackgroundJobCreate(
+        type="es_seeder", metadata={"match_query": "test"}, created_by=self._profile_id
+    )
+    mock_background_job = self._fixture_bj_owned
+    mocks.create.return_value = mock_background_job
+
+    expected_body = self._expected_owned_body
+
+    # when
+    response = self.call_create_api(_CREATE_BODY)
+
+    # then
+    self.assertEqual(response.data, expected_body)
+    self.assertEqual(response.status_code, 201)
+    mocks.create.assert_called_once_with(expected_input)
+
+
+def fails_to_create_a_background_job_when_not_all_required_fields_are_present(self, mocks, data):
+    # given
+    expected_response = {
+        "error": "Not all required fields are present",
+        "status": "error"
+    }
+
+    # when
+    with self.assertRaises(BadRequestException):
+        response = self.call_create_api(_CREATE_BODY_WITHOUT_METADATA)
+
+        # then
+        self.assertEqual(response.get_json(), expected_response)
+        self.assertEqual(response.status_code, 400)
+        mocks.create.assert_not_called()
+
+
+def fails_to_create_a_background_job_when_type_is_not_supported(self, mocks, data):
+    # given
+    expected_response = {
+        "error": "Unsupported job type",
+        "status": "error"
+    }
+    expected_input = BackgroundJobCreate(
+        type="unsupported_type", metadata={}, created_by=self._profile_id)
+    mocks.create.side_effect = BadRequestException(
+        expected_response["error"])
+
+    # when
+    with self.assertRaises(BadRequestException):
+        response = self.call_create_api(_CREATE_BODY_WITH_UNSUPPORTED_TYPE)
+
+        # then
+        self.assertEqual(response.get_json(), expected_response)
+        self.assertEqual(response.status_code, 400)
+        mocks.create.assert_called_once_with(
+            expected_input)
+
+
+def patches_and_returns_a_background_job(self, mocks, data):
+    # given
+    mock_background_job = self._fixture_bj_owned
+    mocks.get.return_value = mock_background_job
+    mocks.patch.return_value = mock_background_job
+
+    expected_input = BackgroundJobPatch(
+        status="running"
+    )
+    expected_body = self._expected_owned_body
+
+    # when
+    response = self.call_update_api(str(mock_background_job._id), _PATCH_BODY_RUNNING)
+
+    # then
+    self.assertEqual(response.data, expected_body)
+    self.assertEqual(response.status_code, 200)
+    mocks.get.assert_called_once_with(
+        str(mock_background_job._id)
+    )
+    mocks.patch.assert_called_once_with(
+        str(mock_background_job._id),
+        expected_input
+    )
+
+
+def fails_to_update_a_background_job_when_no_valid_fields_are_present(self, mocks, data):
+    # given
+    expected_response = {
+        "error": "No valid fields are present",
+        "status": "error"
+    }
+
+    # when
+    with self.assertRaises(BadRequestException):
+        response = self.call_update_api(data["background_job_id"], _EMPTY_BODY)
+
+        # then
+        self.assertEqual(response.get_json(), expected_response)
+        self.assertEqual(response.status_code, 400)
+        mocks.patch.assert_not_called()
+
+
+def fails_to_update_a_background_job_when_background_job_does_not_exist(self, mocks, data):
+    # given
+    mocks.get.return_value = None
+
+    expected_response = {
+        "error": "\"BackgroundJob\" not found.",
+        "status": "error"
+    }
+
+    # when
+    with self.assertRaises(NotFoundException):
+        response = self.call_update_api(data["background_job_id"], _PATCH_BODY_RUNNING)
+
+        # then
+        self.assertEqual(response.get_json(), expected_response)
+        self.assertEqual(response.status_code, 404)
+        mocks.get.assert_called_once_with(data["background_job_id"])
+
+
+def fails_to_update_a_background_job_when_was_created_by_another_user(self, mocks, data):
+    # given
+    mock_background_job = self._fixture_bj_foreign
+    mocks.get.return_value = mock_background_job
+
+    expected_response = {
+        "error": "Forbidden.",
+        "status": "error"
+    }
+
+    # when
+    with self.assertRaises(ForbiddenException):
+        response = self.call_update_api(str(mock_background_job._id), _PATCH_BODY_RUNNING)
+
+        # then
+        self.assertEqual(response.get_json(), expected_response)
+        self.assertEqual(response.status_code, 403)
+        mocks.get.assert_called_once_with(
+            str(mock_background_job._id))
+        mocks.patch.assert_not_called()
+
+
+def creates_and_returns_a_background_job_event(self, mocks, data):
+    # given
+    mock_event = self._fixture_event
+    mock_background_job = self._fixture_bj_owned_with_event
+
+    mocks.get.return_value = mock_background_job
+    mocks.add_event.return_value = mock_background_job
+
+    expected_input = EventCreate(
+        message=mock_event.message, type=mock_event.type)
+    expected_body = self._expected_owned_with_event_body
+
+    # when
+    response = self.call_create_event_api(str(mock_background_job._id), _EVENT_BODY)
+
+    # then
+    self.assertEqual(response.data, expected_body)
+    self.assertEqual(response.status_code, 200)
+    mocks.add_event.assert_called_once_with(
+        str(mock_background_job._id),
+        expected_input
+    )
+
+
+def fails_to_create_a_background_job_event_when_not_all_required_fields_are_present(self, mocks, data):
+    # given
+    expected_response = {
+        "error": "Not all required fields are present",
+        "status": "error"
+    }
+
+    # when
+    with self.assertRaises(BadRequestException):
+        response = self.call_create_event_api(data["background_job_id"], _EVENT_BODY_WITHOUT_MESSAGE)
+
+        # then
+        self.assertEqual(response.get_json(), expected_response)
+        self.assertEqual(response.status_code, 400)
+        mocks.add_event.assert_not_called()
+
+
+def fails_to_create_a_background_job_event_when_job_was_created_by_another_user(self, mocks, data):
+    # given
+    mock_background_job = self._fixture_bj_foreign
+
+    mocks.get.return_value = mock_background_job
+    mocks.add_event.return_value = mock_background_job
+
+    expected_response = {
+        "error": "Forbidden.",
+        "status": "error"
+    }
+
+    # when
+    with self.assertRaises(ForbiddenException):
+        response = self.call_create_event_api(str(mock_background_job._id), _EVENT_BODY)
+
+        # then
+        self.assertEqual(response.get_json(), expected_response)
+        self.assertEqual(response.status_code, 403)
+        mocks.get.assert_called_once_with(
+            str(mock_background_job._id))
+        mocks.add_event.assert_not_called()
+
+
+def fails_to_create_a_background_job_event_when_background_job_does_not_exist(self, mocks, data):
+    # given
+    mocks.get.return_value = None
+
+    expected_response = {
+        "error": "\"BackgroundJob\" not found.",
+        "status": "error"
+    }
+
+    # when
+    with self.assertRaises(NotFoundException):
+        response = self.call_create_event_api(data["background_job_id"], _EVENT_BODY)
+
+        # then
+        self.assertEqual(response.get_json(), expected_response)
+        self.assertEqual(response.status_code, 404)
+        mocks.get.assert_called_once_with(data["background_job_id"])
+        mocks.add_event.assert_not_called()
+
+
+def fails_to_create_a_background_job_event_when_event_type_is_not_supported(self, mocks, data):
+    # given
+    mock_event_create = EventCreate(
+        type="unsupported_type", message="test")
+    mock_background_job = self._fixture_bj_owned
+
+    mocks.get.return_value = mock_background_job
+
+    expected_response = {
+        "error": "Unsupported event type",
+        "status": "error"
+    }
+    mocks.add_event.side_effect = BadRequestException(
+        expected_response["error"])
+
+    # when
+    with self.assertRaises(BadRequestException):
+        response = self.call_create_event_api(str(mock_background_job._id), _EVENT_BODY_WITH_UNSUPPORTED_TYPE)
+        # then
+        self.assertEqual(response.get_json(), expected_response)
+        self.assertEqual(response.status_code, 400)
+        mocks.get.assert_called_once_with(
+            str(mock_background_job._id))
+        mocks.add_event.assert_called_once_with(
+            str(mock_background_job._id), mock_event_create)
 
 
 class BackgroundJobsTestCase(UnitTest):
-    @patch("app.api.v1.background_jobs.get_models")
-    def test_get_background_job(self, get_models: MagicMock):
-        endpoint = "/background_jobs/<string:background_job_id>"
-        self.app.route(endpoint, methods=["GET"])(get_background_job)
-
-        get_background_job_mock = get_models.return_value.background_jobs.get
-
-        profile_id = str(ObjectId())
-
-        def call_api(background_job_id: str):
-            token = create_test_token(
-                profile_id=profile_id, idp_id=f"service|{profile_id}", roles=[FirebaseRole.Service.value])
-
-            return self.test_client.get(
-                endpoint.replace("<string:background_job_id>",
-                                 str(background_job_id)),
-                headers={"Authorization": f"Bearer {token}"},
-                content_type='application/json'
-            )
-
-        @patch("app.api.v1.background_jobs.app_config")
-        def finds_and_returns_a_background_job(app_config_mock: MagicMock):
-            # given
-            mock_background_job = BackgroundJob(
-                status="running", created_by=profile_id, metadata={"match_query": "test"},
+    _GET_CASES = (
+        _case(finds_and_returns_a_background_job),
+        _case(does_not_find_a_background_job_and_returns_an_error, {"background_job_id": "1"}),
+        _case(finds_a_background_job_with_another_creator_and_returns_an_error),
+    )
+    _GET_ALL_CASES = (
+        _case(finds_and_returns_all_background_jobs),
+    )
+    _CREATE_CASES = (
+        _case(creates_and_returns_a_background_job),
+        _case(fails_to_create_a_background_job_when_not_all_required_fields_are_present),
+        _case(fails_to_create_a_background_job_when_type_is_not_supported),
+    )
+    _UPDATE_CASES = (
+        _case(patches_and_returns_a_background_job),
+        _case(fails_to_update_a_background_job_when_no_valid_fields_are_present, {"background_job_id": "1"}),
+        _case(fails_to_update_a_background_job_when_background_job_does_not_exist, {"background_job_id": "1"}),
+        _case(fails_to_update_a_background_job_when_was_created_by_another_user),
+    )
+    _CREATE_EVENT_CASES = (
+        _case(creates_and_returns_a_background_job_event),
+        _case(fails_to_create_a_background_job_event_when_not_all_required_fields_are_present,
+              {"background_job_id": "1"}),
+        _case(fails_to_create_a_background_job_event_when_job_was_created_by_another_user),
+        _case(fails_to_create_a_background_job_event_when_background_job_does_not_exist,
+              {"background_job_id": "1"}),
+        _case(fails_to_create_a_background_job_event_when_event_type_is_not_supported),
+    )
+
+    @classmethod
+    def setUpClass(cls) -> None:
+        super().setUpClass()
+
+        # The same service token serves every request, so it is signed only once
+        cls._profile_id = str(ObjectId())
+        cls._idp_id = f"service|{cls._profile_id}"
+        cls._service_token = create_test_token(
+            profile_id=cls._profile_id, idp_id=cls._idp_id, roles=[FirebaseRole.Service.value])
+        # Headers are the same for every request, so they go straight into the WSGI environ
+        cls._environ_base = {
+            "HTTP_AUTHORIZATION": f"Bearer {cls._service_token}",
+            "CONTENT_TYPE": "application/json"
+        }
+
+        # Routes are registered once, Flask does not allow adding them after the first request
+        cls.app = cls.create_app()
+        for rule, view_func, methods in _ROUTES:
+            cls.app.add_url_rule(rule, endpoint=f"{view_func.__name__}_test", view_func=view_func, methods=methods)
+
+        # Fixtures are never modified by the handlers, so every case shares them and their expected JSON
+        cls._fixture_bj_owned = BackgroundJob(
+            status="running", created_by=cls._profile_id, metadata={"match_query": "test"},
+            type="es_seeder")
+        cls._fixture_bj_owned_json = cls._fixture_bj_owned.to_json()
+        cls._fixture_bj_foreign = BackgroundJob(
+            status="running", created_by="someone_else", metadata={"match_query": "test"},
+            type="es_seeder")
+        cls._fixture_bjs_owned = [
+            cls._fixture_bj_owned,
+            BackgroundJob(
+                status="running", created_by=cls._profile_id, metadata={"match_query": "test"},
                 type="es_seeder")
-            get_background_job_mock.return_value = mock_background_job
-            app_config_mock.__getitem__.side_effect = lambda key: TEST_AUTH_NAMESPACE if key == 'FB_NAMESPACE' else None
-
-            expected_response = {
-                "status": "ok",
-                "data": mock_background_job.to_json()
-            }
-
-            # when
-            response = call_api(str(mock_background_job._id))
-
-            # then
-            self.assertEqual(response.get_json(), expected_response)
-            self.assertEqual(response.status_code, 200)
-            get_background_job_mock.assert_called_once_with(
-                str(mock_background_job._id)
-            )
-
-        def does_not_find_a_background_job_and_returns_an_error():
-            # given
-            mock_id = "1"
-            get_background_job_mock.return_value = None
-
-            expected_response = {
-                "status": "error",
-                "error": "\"BackgroundJob\" not found."
-            }
-
-            # when
-            with self.assertRaises(NotFoundException):
-                response = call_api(mock_id)
-
-                # then
-                self.assertEqual(response.get_json(), expected_response)
-                self.assertEqual(response.status_code, 404)
-                get_background_job_mock.assert_called_once_with(mock_id)
-
-        def finds_a_background_job_with_another_creator_and_returns_an_error():
-            # given
-            mock_background_job = BackgroundJob(
-                status="running", created_by="someone_else", metadata={"match_query": "test"},
-                type="es_seeder")
-            get_background_job_mock.return_value = mock_background_job
-
-            expected_response = {
-                "status": "error",
-                "error": "Forbidden."
-            }
-
-            # when
-            with self.assertRaises(ForbiddenException):
-                response = call_api(str(mock_background_job._id))
-
-                # then
-                self.assertEqual(response.get_json(), expected_response)
-                self.assertEqual(response.status_code, 403)
-                get_background_job_mock.assert_called_once_with(
-                    str(mock_background_job._id))
-
-        tests = [
-            finds_and_returns_a_background_job,
-            does_not_find_a_background_job_and_returns_an_error,
-            finds_a_background_job_with_another_creator_and_returns_an_error
         ]
+        cls._fixture_bjs_owned_json = to_json(cls._fixture_bjs_owned)
+        cls._fixture_event = Event(message="test", type="info")
+        cls._fixture_bj_owned_with_event = BackgroundJob(
+            status="running", created_by=cls._profile_id, metadata={"match_query": "test"},
+            type="es_seeder", events=[cls._fixture_event])
+        cls._fixture_bj_owned_with_event_json = cls._fixture_bj_owned_with_event.to_json()
 
-        for test in tests:
-            with self.subTest(test.__name__):
-                test()
-            get_background_job_mock.reset_mock()
-
-    @patch("app.api.v1.background_jobs.get_models")
-    def test_get_all_background_jobs(self, get_models: MagicMock):
-        endpoint = "/background_jobs"
-        self.app.route(endpoint, methods=["GET"])(get_all_background_jobs)
-
-        get_all_background_jobs_mock = get_models.return_value.background_jobs.get_all
-
-        profile_id = str(ObjectId())
-
-        def call_api():
-            token = create_test_token(
-                profile_id=profile_id, idp_id=f"service|{profile_id}", roles=[FirebaseRole.Service.value])
-
-            return self.test_client.get(
-                endpoint,
-                headers={"Authorization": f"Bearer {token}"},
-                content_type='application/json'
-            )
-
-        def finds_and_returns_all_background_jobs():
-            # given
-            mock_background_jobs = [
-                BackgroundJob(
-                    status="running", created_by=profile_id, metadata={"match_query": "test"},
-                    type="es_seeder"),
-                BackgroundJob(
-                    status="running", created_by=profile_id, metadata={"match_query": "test"},
-                    type="es_seeder")
-            ]
-            get_all_background_jobs_mock.return_value = mock_background_jobs
-
-            expected_response = {
-                "status": "ok",
-                "data": to_json(mock_background_jobs)
-            }
-
-            # when
-            response = call_api()
-
-            # then
-            self.assertEqual(response.get_json(), expected_response)
-            self.assertEqual(response.status_code, 200)
-            get_all_background_jobs_mock.assert_called_once()
-
-        tests = [
-            finds_and_returns_all_background_jobs,
-        ]
+        # Successful responses are compared byte for byte, encoded by the app's own JSON provider
+        cls._expected_owned_body = cls._encode_success(cls._fixture_bj_owned_json)
+        cls._expected_owned_list_body = cls._encode_success(cls._fixture_bjs_owned_json)
+        cls._expected_owned_with_event_body = cls._encode_success(cls._fixture_bj_owned_with_event_json)
 
-        for test in tests:
-            with self.subTest(test.__name__):
-                test()
-            get_all_background_jobs_mock.reset_mock()
-
-    @patch("app.api.v1.background_jobs.get_models")
-    def test_create_background_job(self, get_models: MagicMock):
-        endpoint = "/background_jobs"
-        self.app.route(endpoint, methods=["POST"])(create_background_job)
-
-        create_background_job_mock = get_models.return_value.background_jobs.create
-
-        profile_id = str(ObjectId())
-
-        def call_api(body):
-            token = create_test_token(
-                profile_id=profile_id, idp_id=f"service|{profile_id}", roles=[FirebaseRole.Service.value])
-
-            return self.test_client.post(
-                endpoint,
-                data=json.dumps(body),
-                headers={"Authorization": f"Bearer {token}"},
-                content_type='application/json'
-            )
-
-        @patch("app.api.v1.background_jobs.app_config")
-        def creates_and_returns_a_background_job(app_config_mock: MagicMock):
-            # given
-            expected_input = BackgroundJobCreate(
-                type="es_seeder", metadata={"match_query": "test"}, created_by=profile_id
-            )
-            mock_background_job = BackgroundJob(
-                status="running",
-                created_by=expected_input.created_by,
-                metadata=expected_input.metadata,
-                type=expected_input.type
-            )
-            create_background_job_mock.return_value = mock_background_job
-            app_config_mock.__getitem__.side_effect = lambda key: TEST_AUTH_NAMESPACE if key == 'FB_NAMESPACE' else None
-
-            expected_response = {
-                "status": "ok",
-                "data": mock_background_job.to_json()
-            }
-
-            # when
-            response = call_api({
-                "type": "es_seeder",
-                "metadata": expected_input.metadata
-            })
-
-            # then
-            self.assertEqual(response.get_json(), expected_response)
-            self.assertEqual(response.status_code, 201)
-            create_background_job_mock.assert_called_once_with(expected_input)
-
-        def fails_to_create_a_background_job_when_not_all_required_fields_are_present():
-            # given
-            expected_response = {
-                "error": "Not all required fields are present",
-                "status": "error"
-            }
-
-            # when
-            with self.assertRaises(BadRequestException):
-                response = call_api({
-                    "type": "es_seeder"
-                })
-
-                # then
-                self.assertEqual(response.get_json(), expected_response)
-                self.assertEqual(response.status_code, 400)
-                create_background_job_mock.assert_not_called()
-
-        def fails_to_create_a_background_job_when_type_is_not_supported():
-            # given
-            expected_response = {
-                "error": "Unsupported job type",
-                "status": "error"
-            }
-            expected_input = BackgroundJobCreate(
-                type="unsupported_type", metadata={}, created_by=profile_id)
-            create_background_job_mock.side_effect = BadRequestException(
-                expected_response["error"])
-
-            # when
-            with self.assertRaises(BadRequestException):
-                response = call_api({
-                    "type": expected_input.type,
-                    "metadata": expected_input.metadata
-                })
-
-                # then
-                self.assertEqual(response.get_json(), expected_response)
-                self.assertEqual(response.status_code, 400)
-                create_background_job_mock.assert_called_once_with(
-                    expected_input)
-
-        tests = [
-            creates_and_returns_a_background_job,
-            fails_to_create_a_background_job_when_not_all_required_fields_are_present,
-            fails_to_create_a_background_job_when_type_is_not_supported
-        ]
+        # The models mock and its child tree are built once and reset before each test
+        cls._get_models_mock = MagicMock()
+        cls._background_jobs_mock = cls._get_models_mock.return_value.background_jobs
+        cls._models_method_mocks = tuple(
+            getattr(cls._background_jobs_mock, name) for name in ("get", "get_all", "create", "patch", "add_event"))
 
-        for test in tests:
-            with self.subTest(test.__name__):
-                test()
-            create_background_job_mock.reset_mock()
-
-    @patch("app.api.v1.background_jobs.get_models")
-    def test_update_background_job(self, get_models: MagicMock):
-        endpoint = "/background_jobs/<string:background_job_id>"
-        self.app.route(endpoint, methods=["PATCH"])(update_background_job)
-
-        get_background_job_mock = get_models.return_value.background_jobs.get
-        patch_background_job_mock = get_models.return_value.background_jobs.patch
-
-        profile_id = str(ObjectId())
-
-        def call_api(background_job_id: str, body: dict):
-            token = create_test_token(
-                profile_id=profile_id, idp_id=f"service|{profile_id}", roles=[FirebaseRole.Service.value])
-
-            return self.test_client.patch(
-                endpoint.replace("<string:background_job_id>",
-                                 background_job_id),
-                data=json.dumps(body),
-                headers={"Authorization": f"Bearer {token}"},
-                content_type='application/json'
-            )
-
-        @patch("app.api.v1.background_jobs.app_config")
-        def patches_and_returns_a_background_job(app_config_mock: MagicMock):
-            # given
-            mock_background_job = BackgroundJob(
-                status="running", created_by=profile_id, metadata={"match_query": "test"},
-                type="es_seeder")
-            get_background_job_mock.return_value = mock_background_job
-            patch_background_job_mock.return_value = mock_background_job
-            app_config_mock.__getitem__.side_effect = lambda key: TEST_AUTH_NAMESPACE if key == 'FB_NAMESPACE' else None
-
-            expected_input = BackgroundJobPatch(
-                status="running"
-            )
-            expected_response = {
-                "status": "ok",
-                "data": mock_background_job.to_json()
-            }
-
-            # when
-            response = call_api(str(mock_background_job._id), {
-                "status": mock_background_job.status
-            })
-
-            # then
-            self.assertEqual(response.get_json(), expected_response)
-            self.assertEqual(response.status_code, 200)
-            get_background_job_mock.assert_called_once_with(
-                str(mock_background_job._id)
-            )
-            patch_background_job_mock.assert_called_once_with(
-                str(mock_background_job._id),
-                expected_input
-            )
-
-        def fails_to_update_a_background_job_when_no_valid_fields_are_present():
-            # given
-            expected_response = {
-                "error": "No valid fields are present",
-                "status": "error"
-            }
-
-            # when
-            with self.assertRaises(BadRequestException):
-                response = call_api("1", {})
-
-                # then
-                self.assertEqual(response.get_json(), expected_response)
-                self.assertEqual(response.status_code, 400)
-                patch_background_job_mock.assert_not_called()
-
-        def fails_to_update_a_background_job_when_background_job_does_not_exist():
-            # given
-            mock_id = "1"
-            get_background_job_mock.return_value = None
-
-            expected_response = {
-                "error": "\"BackgroundJob\" not found.",
-                "status": "error"
-            }
-
-            # when
-            with self.assertRaises(NotFoundException):
-                response = call_api(mock_id, {"status": "running"})
-
-                # then
-                self.assertEqual(response.get_json(), expected_response)
-                self.assertEqual(response.status_code, 404)
-                get_background_job_mock.assert_called_once_with(mock_id)
-
-        def fails_to_update_a_background_job_when_was_created_by_another_user():
-            # given
-            mock_background_job = BackgroundJob(
-                status="running", created_by="someone_else", metadata={"match_query": "test"},
-                type="es_seeder")
-            get_background_job_mock.return_value = mock_background_job
-
-            expected_response = {
-                "error": "Forbidden.",
-                "status": "error"
-            }
-
-            # when
-            with self.assertRaises(ForbiddenException):
-                response = call_api(str(mock_background_job._id), {
-                                    "status": "running"})
-
-                # then
-                self.assertEqual(response.get_json(), expected_response)
-                self.assertEqual(response.status_code, 403)
-                get_background_job_mock.assert_called_once_with(
-                    str(mock_background_job._id))
-                patch_background_job_mock.assert_not_called()
-
-        tests = [
-            patches_and_returns_a_background_job,
-            fails_to_update_a_background_job_when_no_valid_fields_are_present,
-            fails_to_update_a_background_job_when_background_job_does_not_exist,
-            fails_to_update_a_background_job_when_was_created_by_another_user
-        ]
+    @classmethod
+    def _encode_success(cls, data) -> bytes:
+        return cls.app.json.response({"status": "ok", "data": data}).get_data()
 
-        for test in tests:
-            with self.subTest(test.__name__):
-                test()
-            get_background_job_mock.reset_mock()
-            patch_background_job_mock.reset_mock()
-
-    @patch("app.api.v1.background_jobs.get_models")
-    def test_create_background_job_event(self, get_models: MagicMock):
-        endpoint = "/background_jobs/<string:background_job_id>/events"
-        self.app.route(endpoint, methods=["POST"])(create_background_job_event)
-
-        get_background_job_mock = get_models.return_value.background_jobs.get
-        add_background_job_event_mock = get_models.return_value.background_jobs.add_event
-
-        profile_id = str(ObjectId())
-
-        def call_api(background_job_id: str, body: dict):
-            token = create_test_token(
-                profile_id=profile_id, idp_id=f"service|{profile_id}", roles=[FirebaseRole.Service.value])
-
-            return self.test_client.post(
-                endpoint.replace("<string:background_job_id>",
-                                 background_job_id),
-                data=json.dumps(body),
-                headers={"Authorization": f"Bearer {token}"},
-                content_type='application/json'
-            )
-
-        @patch("app.api.v1.background_jobs.app_config")
-        def creates_and_returns_a_background_job_event(app_config_mock: MagicMock):
-            # given
-            mock_event = Event(message="test", type="info")
-            mock_background_job = BackgroundJob(
-                status="running", created_by=profile_id, metadata={"match_query": "test"},
-                type="es_seeder", events=[mock_event])
-            app_config_mock.__getitem__.side_effect = lambda key: TEST_AUTH_NAMESPACE if key == 'FB_NAMESPACE' else None
-
-            get_background_job_mock.return_value = mock_background_job
-            add_background_job_event_mock.return_value = mock_background_job
-
-            expected_input = EventCreate(
-                message=mock_event.message, type=mock_event.type)
-            expected_response = {
-                "status": "ok",
-                "data": mock_background_job.to_json()
-            }
-
-            # when
-            response = call_api(str(mock_background_job._id), {
-                "type": mock_event.type,
-                "message": mock_event.message
-            })
-
-            # then
-            self.assertEqual(response.get_json(), expected_response)
-            self.assertEqual(response.status_code, 200)
-            add_background_job_event_mock.assert_called_once_with(
-                str(mock_background_job._id),
-                expected_input
-            )
-
-        def fails_to_create_a_background_job_event_when_not_all_required_fields_are_present():
-            # given
-            expected_response = {
-                "error": "Not all required fields are present",
-                "status": "error"
-            }
-
-            # when
-            with self.assertRaises(BadRequestException):
-                response = call_api("1", {
-                    "type": "info"
-                })
-
-                # then
-                self.assertEqual(response.get_json(), expected_response)
-                self.assertEqual(response.status_code, 400)
-                add_background_job_event_mock.assert_not_called()
-
-        def fails_to_create_a_background_job_event_when_job_was_created_by_another_user():
-            # given
-            mock_event = Event(message="test", type="info")
-            mock_background_job = BackgroundJob(
-                status="running", created_by="someone_else", metadata={"match_query": "test"},
-                type="es_seeder", events=[mock_event])
-
-            get_background_job_mock.return_value = mock_background_job
-            add_background_job_event_mock.return_value = mock_background_job
-
-            expected_response = {
-                "error": "Forbidden.",
-                "status": "error"
-            }
-
-            # when
-            with self.assertRaises(ForbiddenException):
-                response = call_api(str(mock_background_job._id), {
-                    "type": mock_event.type,
-                    "message": mock_event.message
-                })
-
-                # then
-                self.assertEqual(response.get_json(), expected_response)
-                self.assertEqual(response.status_code, 403)
-                get_background_job_mock.assert_called_once_with(
-                    str(mock_background_job._id))
-                add_background_job_event_mock.assert_not_called()
-
-        def fails_to_create_a_background_job_event_when_background_job_does_not_exist():
-            # given
-            mock_id = "1"
-            get_background_job_mock.return_value = None
-
-            expected_response = {
-                "error": "\"BackgroundJob\" not found.",
-                "status": "error"
-            }
-
-            # when
-            with self.assertRaises(NotFoundException):
-                response = call_api(mock_id, {
-                    "type": "info",
-                    "message": "test"
-                })
-
-                # then
-                self.assertEqual(response.get_json(), expected_response)
-                self.assertEqual(response.status_code, 404)
-                get_background_job_mock.assert_called_once_with(mock_id)
-                add_background_job_event_mock.assert_not_called()
-
-        @patch("app.api.v1.background_jobs.app_config")
-        def fails_to_create_a_background_job_event_when_event_type_is_not_supported(app_config_mock: MagicMock):
-            # given
-            mock_event_create = EventCreate(
-                type="unsupported_type", message="test")
-            mock_background_job = BackgroundJob(
-                status="running", created_by=profile_id, metadata={"match_query": "test"},
-                type="es_seeder")
-            app_config_mock.__getitem__.side_effect = lambda key: TEST_AUTH_NAMESPACE if key == 'FB_NAMESPACE' else None
-
-            get_background_job_mock.return_value = mock_background_job
-
-            expected_response = {
-                "error": "Unsupported event type",
-                "status": "error"
-            }
-            add_background_job_event_mock.side_effect = BadRequestException(
-                expected_response["error"])
-
-            # when
-            with self.assertRaises(BadRequestException):
-                response = call_api(str(mock_background_job._id), {
-                    "type": mock_event_create.type,
-                    "message": mock_event_create.message
-                })
-                # then
-                self.assertEqual(response.get_json(), expected_response)
-                self.assertEqual(response.status_code, 400)
-                get_background_job_mock.assert_called_once_with(
-                    str(mock_background_job._id))
-                add_background_job_event_mock.assert_called_once_with(
-                    str(mock_background_job._id), mock_event_create)
-
-        tests = [
-            creates_and_returns_a_background_job_event,
-            fails_to_create_a_background_job_event_when_not_all_required_fields_are_present,
-            fails_to_create_a_background_job_event_when_job_was_created_by_another_user,
-            fails_to_create_a_background_job_event_when_background_job_does_not_exist,
-            fails_to_create_a_background_job_event_when_event_type_is_not_supported
-        ]
+    def setUp(self) -> None:
+        self.test_client = self.app.test_client()
+
+        self._get_models_mock.reset_mock()
+        for method_mock in self._models_method_mocks:
+            method_mock.reset_mock(return_value=True, side_effect=True)
+
+        # Swap the module dependencies directly, it is much cheaper than mock.patch
+        self.patcher = AttrPatcher()
+        self.patcher.setattr(background_jobs_api, "get_models", self._get_models_mock)
+        self.patcher.setattr(background_jobs_api, "app_config", {"FB_NAMESPACE": TEST_AUTH_NAMESPACE})
+
+    def tearDown(self) -> None:
+        self.patcher.undo_all()
+
+        super().tearDown()
+
+    def run_cases(self, cases):
+        for name, case, data in cases:
+            with self.subTest(name):
+                case(self, self._background_jobs_mock, data)
+            self._get_models_mock.reset_mock()
+
+    def call_api(self, method: str, path: str, body: Optional[bytes] = None):
+        return self.test_client.open(path, method=method, data=body, environ_base=self._environ_base)
+
+    def call_get_api(self, background_job_id: str):
+        return self.call_api("GET", _GET_PATH_TMPL.format(bjid=background_job_id))
+
+    def call_get_all_api(self):
+        return self.call_api("GET", _COLLECTION_PATH)
+
+    def call_create_api(self, body: bytes):
+        return self.call_api("POST", _COLLECTION_PATH, body)
+
+    def call_update_api(self, background_job_id: str, body: bytes):
+        return self.call_api("PATCH", _GET_PATH_TMPL.format(bjid=background_job_id), body)
+
+    def call_create_event_api(self, background_job_id: str, body: bytes):
+        return self.call_api("POST", _EVENTS_PATH_TMPL.format(bjid=background_job_id), body)
+
+    def test_get_background_job(self):
+        self.run_cases(self._GET_CASES)
+
+    def test_get_all_background_jobs(self):
+        self.run_cases(self._GET_ALL_CASES)
+
+    def test_create_background_job(self):
+        self.run_cases(self._CREATE_CASES)
+
+    def test_update_background_job(self):
+        self.run_cases(self._UPDATE_CASES)
 
-        for test in tests:
-            with self.subTest(test.__name__):
-                test()
-            get_background_job_mock.reset_mock()
-            add_background_job_event_mock.reset_mock()
+    def test_create_background_job_event(self):
+        self.run_cases(self._CREATE_EVENT_CASES)
@@ -1,4 +1,5 @@
 from app.models.products import ProductPatch, ProductsModel
+from app.models.tags import TagCreate
 from tests.integration_test import IntegrationTest
 
 
@@ -17,6 +18,54 @@ class ProductsModelTestCase(IntegrationTest):
         self.assertIsNotNone(retrieved_product)
         self.assertEqual(product.name, retrieved_product.name)
 
+    def test_get_product_without_tags(self):
+        products_model = self.models.products
+
+        # given
+        product = self.fixtures.product
+
+        # when
+        retrieved_product = products_model.get(str(product._id), with_tags=False)
+
+        # then
+        self.assertIsNotNone(retrieved_product)
+        self.assertEqual(product.name, retrieved_product.name)
+        self.assertEqual(product.genres, retrieved_product.genres)
+        self.assertEqual(product.categories, retrieved_product.categories)
+
+    def test_resolves_genre_and_category_names(self):
+        products_model = self.models.products
+
+        # given
+        genre, cleanup = self.factory.tags.create(TagCreate(name="Integration Genre"))
+        self.addCleanup(cleanup)
+        category, cleanup = self.factory.tags.create(TagCreate(name="Integration Category"))
+        self.addCleanup(cleanup)
+
+        product = self.fixtures.product.clone()
+        product.slug = f"{product.slug}-{product._id}"
+        product.genres = [genre._id]
+        product.categories = [category._id]
+        created_product, cleanup = self.factory.products.create(product)
+        self.addCleanup(cleanup)
+
+        # when
+        retrieved_products = {
+            "get": products_model.get(str(created_product._id)),
+            "get_by_slug": products_model.get_by_slug(created_product.slug),
+            "get_all": next(
+                (item for item in products_model.get_all() if item._id == created_product._id), None)
+        }
+
+        # then
+        for method, retrieved_product in retrieved_products.items():
+            with self.subTest(method):
+                self.assertIsNotNone(retrieved_product)
+                self.assertEqual(retrieved_product.genres, [genre.name])
+                self.assertEqual(retrieved_product.categories, [category.name])
+                self.assertNotIn("tag_ids", vars(retrieved_product))
+                self.assertNotIn("tags_joined", vars(retrieved_product))
+
     def test_create_product(self):
         # given
         product = self.fixtures.product.clone()
@@ -0,0 +1,281 @@
+import datetime
+from unittest.mock import MagicMock, patch
+
+from bson import ObjectId
+from bson.errors import InvalidId
+from pymongo import ReturnDocument
+
+from app.models.products import Product, ProductPatch, ProductsModel
+from tests import UnitTest
+from tests.mocks.database import mock_collection
+
+
+def create_product_doc(**kwargs):
+    """Builds a product document the way the aggregation pipeline returns it, with tag names resolved
+    """
+    now = datetime.datetime.utcnow().replace(microsecond=0)
+
+    return {
+        "_id": ObjectId(),
+        "type": "Game",
+        "name": "Geometry Dash",
+        "slug": "geometry-dash",
+        "required_age": 0,
+        "short_description": "GD",
+        "detailed_description": "Geometry dash cool game real",
+        "is_free": False,
+        "platforms": {"steam": "https://store.steampowered.com/app/322170/Geometry_Dash/"},
+        "price": {},
+        "supported_languages": ["English"],
+        "media": None,
+        "requirements": None,
+        "developers": ["RobTop Games"],
+        "publishers": ["RobTop Games"],
+        "platforms_os": ["windows", "mac"],
+        "categories": ["Action"],
+        "genres": ["Arcade"],
+        "release_date": {"date": "2014-12-22", "coming_soon": False},
+        "created_at": now,
+        "updated_at": now
+    } | kwargs
+
+
+class ProductsTestCase(UnitTest):
+
+    @patch("app.models.products.Database")
+    def test_get_product(self, db: MagicMock):
+        collection_mock = mock_collection(db, 'products')
+
+        def gets_and_returns_a_product_with_tag_names():
+            # given
+            model = ProductsModel(db)
+            mock_product = create_product_doc()
+            collection_mock.aggregate.return_value = iter([mock_product])
+
+            # when
+            result = model.get(str(mock_product["_id"]))
+
+            # then
+            self.assertEqual(result.name, mock_product["name"])
+            self.assertEqual(result.genres, ["Arcade"])
+            collection_mock.aggregate.assert_called_once_with(
+                model.get_aggregation_pipeline({"_id": mock_product["_id"]}, limit=1),
+                batchSize=1
+            )
+            collection_mock.find_one.assert_not_called()
+
+        def gets_and_returns_a_product_without_tag_names():
+            # given
+            model = ProductsModel(db)
+            genre_id = ObjectId()
+            mock_product = create_product_doc(genres=[genre_id])
+            collection_mock.find_one.return_value = mock_product
+
+            # when
+            result = model.get(str(mock_product["_id"]), with_tags=False)
+
+            # then
+            self.assertEqual(result.genres, [genre_id])
+            collection_mock.find_one.assert_called_once_with({"_id": mock_product["_id"]})
+            collection_mock.aggregate.assert_not_called()
+
+        def fails_to_get_a_nonexistent_product():
+            # given
+            model = ProductsModel(db)
+            collection_mock.aggregate.return_value = iter([])
+
+            # when
+            result = model.get(str(ObjectId()))
+
+            # then
+            self.assertIsNone(result)
+
+        tests = [
+            gets_and_returns_a_product_with_tag_names,
+            gets_and_returns_a_product_without_tag_names,
+            fails_to_get_a_nonexistent_product
+        ]
+
+        self.run_subtests(tests, after_each=collection_mock.reset_mock)
+
+    @patch("app.models.products.Database")
+    def test_get_all_products(self, db: MagicMock):
+        collection_mock = mock_collection(db, 'products')
+
+        def gets_and_yields_all_products():
+            # given
+            model = ProductsModel(db)
+            incomplete_product = create_product_doc()
+            for key in ("_id", "created_at", "updated_at"):
+                del incomplete_product[key]
+            mock_products = [create_product_doc(), incomplete_product]
+            collection_mock.aggregate.return_value = iter([dict(product) for product in mock_products])
+
+            # when
+            result = list(model.get_all())
+
+            # then
+            self.assertEqual(len(result), 2)
+            self.assertIsInstance(result[0], Product)
+            self.assertEqual(result[0]._id, mock_products[0]["_id"])
+            self.assertEqual(result[0].release_date.date, "2014-12-22")
+            self.assertEqual(result[0].to_json(), Product(**mock_products[0]).to_json())
+            self.assertIsInstance(result[1]._id, ObjectId)
+            self.assertIsInstance(result[1].created_at, datetime.datetime)
+            self.assertIsInstance(result[1].updated_at, datetime.datetime)
+            self.assertEqual(result[1].name, incomplete_product["name"])
+            collection_mock.aggregate.assert_called_once_with(model.get_aggregation_pipeline())
+
+        def projects_the_products_before_the_lookup():
+            # given
+            model = ProductsModel(db)
+            collection_mock.aggregate.return_value = iter([])
+
+            # when
+            list(model.get_all(projection=ProductsModel.list_projection))
+
+            # then
+            pipeline = collection_mock.aggregate.call_args.args[0]
+            self.assertEqual(pipeline[1], {"$project": ProductsModel.list_projection})
+            self.assertIn("$lookup", pipeline[3])
+
+        def yields_nothing_when_there_are_no_products():
+            # given
+            model = ProductsModel(db)
+            collection_mock.aggregate.return_value = iter([])
+
+            # when
+            result = list(model.get_all())
+
+            # then
+            self.assertEqual(result, [])
+
+        tests = [
+            gets_and_yields_all_products,
+            projects_the_products_before_the_lookup,
+            yields_nothing_when_there_are_no_products
+        ]
+
+        self.run_subtests(tests, after_each=collection_mock.reset_mock)
+
+    @patch("app.models.products.Database")
+    def test_patch_product(self, db: MagicMock):
+        collection_mock = mock_collection(db, 'products')
+
+        def patches_and_returns_the_updated_product():
+            # given
+            model = ProductsModel(db)
+            existing_product = create_product_doc()
+            mock_product = existing_product | {"name": "Updated Name"}
+            collection_mock.find_one.return_value = existing_product
+            collection_mock.find_one_and_update.return_value = mock_product
+
+            # when
+            result = model.patch(str(mock_product["_id"]), ProductPatch(
+                name="Updated Name", slug=existing_product["slug"]))
+
+            # then
+            self.assertEqual(result.name, "Updated Name")
+            collection_mock.find_one.assert_called_once_with({"_id": mock_product["_id"]})
+            collection_mock.find_one_and_update.assert_called_once_with(
+                {"_id": mock_product["_id"]},
+                {"$set": {"name": "Updated Name", "slug": existing_product["slug"]}},
+                return_document=ReturnDocument.AFTER
+            )
+
+        def patches_in_one_update_when_a_nested_field_is_resent_in_another_key_order():
+            # given
+            model = ProductsModel(db)
+            existing_product = create_product_doc()
+            mock_product = existing_product | {"name": "Updated Name"}
+            collection_mock.find_one.return_value = existing_product
+            collection_mock.find_one_and_update.return_value = mock_product
+            release_date = {"coming_soon": False, "date": "2014-12-22"}
+
+            # when
+            result = model.patch(str(mock_product["_id"]), ProductPatch(
+                name="Updated Name", release_date=release_date))
+
+            # then
+            self.assertEqual(result.name, "Updated Name")
+            collection_mock.find_one_and_update.assert_called_once_with(
+                {"_id": mock_product["_id"]},
+                {"$set": {"name": "Updated Name", "release_date": release_date}},
+                return_document=ReturnDocument.AFTER
+            )
+
+        def returns_the_product_as_it_is_when_a_nested_field_is_resent_in_another_key_order():
+            # given
+            model = ProductsModel(db)
+            mock_product = create_product_doc()
+            collection_mock.find_one.return_value = mock_product
+
+            # when
+            result = model.patch(str(mock_product["_id"]), ProductPatch(
+                release_date={"coming_soon": False, "date": "2014-12-22"}))
+
+            # then
+            self.assertEqual(result.name, mock_product["name"])
+            collection_mock.find_one_and_update.assert_not_called()
+
+        def returns_the_product_as_it_is_when_there_is_nothing_to_patch():
+            # given
+            model = ProductsModel(db)
+            mock_product = create_product_doc()
+            collection_mock.find_one.return_value = mock_product
+
+            # when
+            result = model.patch(str(mock_product["_id"]), ProductPatch())
+
+            # then
+            self.assertEqual(result.name, mock_product["name"])
+            collection_mock.find_one_and_update.assert_not_called()
+
+        def returns_the_product_as_it_is_when_nothing_has_changed():
+            # given
+            model = ProductsModel(db)
+            mock_product = create_product_doc()
+            collection_mock.find_one.return_value = mock_product
+
+            # when
+            result = model.patch(str(mock_product["_id"]), ProductPatch(
+                name=mock_product["name"], genres=mock_product["genres"]))
+
+            # then
+            self.assertEqual(result.name, mock_product["name"])
+            collection_mock.find_one_and_update.assert_not_called()
+
+        def fails_to_patch_a_product_because_id_is_invalid():
+            # given
+            model = ProductsModel(db)
+
+            # when & then
+            with self.assertRaises(InvalidId):
+                model.patch("invalid_id", ProductPatch(name="Updated Name"))
+
+            collection_mock.find_one.assert_not_called()
+            collection_mock.find_one_and_update.assert_not_called()
+
+        def fails_to_patch_a_nonexistent_product():
+            # given
+            model = ProductsModel(db)
+            collection_mock.find_one.return_value = None
+
+            # when
+            result = model.patch(str(ObjectId()), ProductPatch(name="Updated Name"))
+
+            # then
+            self.assertIsNone(result)
+            collection_mock.find_one_and_update.assert_not_called()
+
+        tests = [
+            patches_and_returns_the_updated_product,
+            patches_in_one_update_when_a_nested_field_is_resent_in_another_key_order,
+            returns_the_product_as_it_is_when_a_nested_field_is_resent_in_another_key_order,
+            returns_the_product_as_it_is_when_there_is_nothing_to_patch,
+            returns_the_product_as_it_is_when_nothing_has_changed,
+            fails_to_patch_a_product_because_id_is_invalid,
+            fails_to_patch_a_nonexistent_product
+        ]
+
+        self.run_subtests(tests, after_each=collection_mock.reset_mock)
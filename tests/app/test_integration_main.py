@@ -8,27 +8,20 @@ from app.models import ModelsExtension
 
 class MainTestCase(IntegrationTest):
 
-    def setUp(self) -> None:
-        self.app = Flask(__name__)
+    @classmethod
+    def setUpClass(cls) -> None:
+        super().setUpClass()
 
-    def test_main_injects_dependencies(self):
-        # given
-        app = Flask(__name__)
-
-        # when
-        main(app)
+        # Initializing the extensions is the expensive part, so main runs once for the class
+        cls.main_app = Flask(__name__)
+        main(cls.main_app)
 
+    def test_main_injects_dependencies(self):
         # then
-        self.assertEqual(type(app), Flask)
-        self.assertIsNotNone(app.extensions[ServicesExtension.KEY])
-        self.assertIsNotNone(app.extensions[ModelsExtension.KEY])
+        self.assertEqual(type(self.main_app), Flask)
+        self.assertIsNotNone(self.main_app.extensions[ServicesExtension.KEY])
+        self.assertIsNotNone(self.main_app.extensions[ModelsExtension.KEY])
 
     def test_main_registers_blueprints(self):
-        # given
-        app = Flask(__name__)
-
-        # when
-        main(app)
-
         # then
-        self.assertNotEqual(len(app.blueprints.keys()), 0)
+        self.assertNotEqual(len(self.main_app.blueprints.keys()), 0)
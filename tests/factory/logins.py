@@ -1,3 +1,4 @@
+import logging
 from dataclasses import dataclass
 from datetime import datetime, timedelta
 from typing import Dict, cast
@@ -6,6 +7,8 @@ from app.models import ModelsExtension
 from app.services.firebase.identity_toolkit import (FirebaseCustomIdentity,
                                                     FirebaseUserIdentity)
 
+logger = logging.getLogger(__name__)
+
 
 @dataclass
 class CacheEntry:
@@ -32,7 +35,7 @@ class LoginsFactory:
                 identity=identity
             )
         except Exception as e:
-            print(f"[Firebase Factory] Failed to cache firebase identity: {e}")
+            logger.warning("[Firebase Factory] Failed to cache firebase identity: %s", e)
 
     def login(self, email: str, password: str, cache: bool = True):
         key = self.create_key(email, password)
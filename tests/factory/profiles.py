@@ -1,13 +1,18 @@
+from concurrent.futures import ThreadPoolExecutor
+from typing import List, Set
+
 from bson import ObjectId
 
 from app.models import ModelsExtension
-from app.models.profiles import ProfileCreate
+from app.models.profiles import Profile, ProfileCreate
 from app.services import ServicesExtension
 
 
 class ProfilesFactory:
     services: ServicesExtension
     models: ModelsExtension
+    # Emails already cleaned up in this session, they do not need another lookup
+    seen_emails: Set[str] = set()
 
     def __init__(self, services: ServicesExtension, models: ModelsExtension) -> None:
         self.services = services
@@ -34,12 +39,48 @@ class ProfilesFactory:
                 # Intentionally skip error
                 pass
 
+    def _delete_user(self, idp_id: str):
+        auth = self.services.firebase.auth
+
+        try:
+            auth.delete_user(idp_id)
+        except auth.UserNotFoundError:
+            # Intentionally skip error if a user does not exist
+            pass
+
+    def _delete_db_profile_quietly(self, profile_id: ObjectId):
+        try:
+            self.delete_db_profile(str(profile_id))
+        except BaseException:
+            # Intentionally skip error
+            pass
+
+    def _cleanup_by_id(self, email: str, idp_id: str, profile_id: ObjectId):
+        # Forget the email first, a later create then looks it up again even if a deletion below fails
+        self.seen_emails.discard(email)
+        self._delete_user(idp_id)
+        self._delete_db_profile_quietly(profile_id)
+
+    def cleanup_many(self, profiles: List[Profile]):
+        self.seen_emails.difference_update(profile.email for profile in profiles)
+
+        # The user and profile deletions are independent, so they are sent concurrently
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            futures = [executor.submit(self._delete_user, profile.idp_id) for profile in profiles]
+            futures += [executor.submit(self._delete_db_profile_quietly, profile._id) for profile in profiles]
+
+        for future in futures:
+            future.result()
+
     def create(self, input: ProfileCreate):
-        self.cleanup(input.email)
+        if input.email not in self.seen_emails:
+            self.cleanup(input.email)
+            self.seen_emails.add(input.email)
 
         profile = self.models.profiles.create(input)
 
-        return profile, lambda: self.cleanup(profile.email)
+        # The created profile already knows its ids, so the email lookups are skipped
+        return profile, lambda: self._cleanup_by_id(profile.email, profile.idp_id, profile._id)
 
     def delete_db_profile(self, profile_id: str):
         model = self.models.profiles
@@ -207,21 +207,25 @@ class IntegrationTest(testicles.IntegrationTest):
 
             # Register new fixtures in this section
 
-            regular_user, cleanup = factory.profiles.create(ProfileCreate(
+            # Registered up front so every profile is cleaned up even if a later create fails
+            fixture_profiles = []
+            cleanups.append(lambda: factory.profiles.cleanup_many(fixture_profiles))
+
+            regular_user, _ = factory.profiles.create(ProfileCreate(
                 email="test_integration+regular@pork.com",
                 password=strong_password,
                 nickname="test_integration_regular",
                 role=FirebaseRole.User
             ))
-            cleanups.append(cleanup)
+            fixture_profiles.append(regular_user)
 
-            admin_user, cleanup = factory.profiles.create(ProfileCreate(
+            admin_user, _ = factory.profiles.create(ProfileCreate(
                 email="test_integration+admin@pork.com",
                 password=strong_password,
                 nickname="test_integration_admin",
                 role=FirebaseRole.Admin
             ))
-            cleanups.append(cleanup)
+            fixture_profiles.append(admin_user)
 
             service_profile, cleanup = factory.service_profiles.create(ServiceProfileCreate(
                 permissions=[]
@@ -0,0 +1,118 @@
+import datetime
+import decimal
+from dataclasses import dataclass
+
+from bson import ObjectId
+from flask import Flask, request
+
+from lib.json_provider import OrjsonProvider
+from tests.unit_test import UnitTest
+
+
+@dataclass
+class Event:
+    name: str
+    created_at: datetime.datetime
+
+
+class OrjsonProviderTestCase(UnitTest):
+
+    def setUp(self) -> None:
+        self.app = Flask(__name__)
+        self.app.json = OrjsonProvider(self.app)
+
+    def test_dumps(self):
+
+        def encodes_object_ids_and_decimals_as_strings():
+            # given
+            object_id = ObjectId()
+
+            # when
+            result = self.app.json.dumps({"_id": object_id, "price": decimal.Decimal("9.99")})
+
+            # then
+            self.assertEqual(result, f'{{"_id":"{object_id}","price":"9.99"}}')
+
+        def encodes_dates_in_the_http_date_format():
+            # when
+            result = self.app.json.dumps({"created_at": datetime.datetime(2024, 1, 1)})
+
+            # then
+            self.assertEqual(result, '{"created_at":"Mon, 01 Jan 2024 00:00:00 GMT"}')
+
+        def encodes_dataclasses_as_objects():
+            # when
+            result = self.app.json.dumps(Event(name="test", created_at=datetime.datetime(2024, 1, 1)))
+
+            # then
+            self.assertEqual(result, '{"created_at":"Mon, 01 Jan 2024 00:00:00 GMT","name":"test"}')
+
+        def sorts_the_keys():
+            # when
+            result = self.app.json.dumps({"status": "ok", "data": {"b": 1, "a": 2}})
+
+            # then
+            self.assertEqual(result, '{"data":{"a":2,"b":1},"status":"ok"}')
+
+        def fails_to_encode_an_unsupported_type():
+            # when & then
+            with self.assertRaises(TypeError):
+                self.app.json.dumps({"value": object()})
+
+        def writes_non_ascii_characters_as_utf8():
+            # when
+            result = self.app.json.dumps({"name": "caf\u00e9"})
+
+            # then
+            self.assertEqual(result, '{"name":"caf\u00e9"}')
+
+        def fails_on_unsupported_arguments():
+            # when & then
+            with self.assertRaises(TypeError):
+                self.app.json.dumps({"status": "ok"}, indent=2)
+
+        tests = [
+            encodes_object_ids_and_decimals_as_strings,
+            encodes_dates_in_the_http_date_format,
+            encodes_dataclasses_as_objects,
+            sorts_the_keys,
+            fails_to_encode_an_unsupported_type,
+            writes_non_ascii_characters_as_utf8,
+            fails_on_unsupported_arguments
+        ]
+
+        self.run_subtests(tests)
+
+    def test_response(self):
+        # when
+        response = self.app.json.response({"status": "ok"})
+
+        # then
+        self.assertEqual(response.get_data(), b'{"status":"ok"}\n')
+        self.assertEqual(response.mimetype, "application/json")
+
+    def test_loads(self):
+        self.app.route("/echo", methods=["POST"])(lambda: request.get_json())
+        test_client = self.app.test_client()
+
+        def decodes_the_request_body():
+            # when
+            response = test_client.post("/echo", data=b'{"name":"test"}', content_type="application/json")
+
+            # then
+            self.assertEqual(response.status_code, 200)
+            self.assertEqual(response.get_json(), {"name": "test"})
+
+        def fails_with_a_bad_request_on_invalid_json():
+            # when
+            response = test_client.post("/echo", data=b'{"name":', content_type="application/json")
+
+            # then
+            self.assertEqual(response.status_code, 400)
+
+        tests = [
+            decodes_the_request_body,
+            fails_with_a_bad_request_on_invalid_json
+        ]
+
+        self.run_subtests(tests)
@@ -9,19 +9,31 @@ from tests.utils.jwt import (MockRequiresAuthExtension,
 
 
 class UnitTest(testicles.UnitTest):
-    def setUp(self) -> None:
-        self.app = Flask(__name__)
+    @staticmethod
+    def create_app():
+        """Creates a Flask application set up for unit tests
 
-        self.app.testing = True
-        self.test_client = self.app.test_client()
+        Returns:
+            Flask: flask application
+        """
+
+        app = Flask(__name__)
+
+        app.testing = True
 
         auth_extension = MockRequiresAuthExtension()
-        auth_extension.init_app(self.app)
+        auth_extension.init_app(app)
 
         role_extension = MockRequiresRoleExtension()
-        role_extension.init_app(self.app)
+        role_extension.init_app(app)
 
-        configure_app(self.app)
+        configure_app(app)
+
+        return app
+
+    def setUp(self) -> None:
+        self.app = self.create_app()
+        self.test_client = self.app.test_client()
 
     def run_subtests(self,
                      tests: list[typing.Callable],
@@ -0,0 +1,18 @@
+import typing
+
+
+class AttrPatcher:
+    "A helper object that swaps attributes in place and restores them on undo"
+
+    def __init__(self) -> None:
+        self._undo: typing.List[typing.Tuple[typing.Any, str, typing.Any]] = []
+
+    def setattr(self, obj: typing.Any, name: str, value: typing.Any):
+        self._undo.append((obj, name, getattr(obj, name)))
+        setattr(obj, name, value)
+
+    def undo_all(self):
+        # Restore in reverse order so repeated patches of one attribute unwind correctly
+        while self._undo:
+            obj, name, value = self._undo.pop()
+            setattr(obj, name, value)